@@ -1,10 +1,31 @@
 #!/usr/bin/env python3
 
+# Only the standard library is used here: the probe starts a new interpreter on
+# every run, and importing requests pulled in urllib3, chardet, idna and certifi
+# each time.
+import http.client
+import json
 import os
+import socket
 import sys
-import requests
+import urllib.request
 
-from requests.packages.urllib3.util.connection import HAS_IPV6
+
+def has_ipv6():
+    """
+    Checks if the IPv6 loopback address can be bound, like urllib3's HAS_IPV6
+    """
+    if not socket.has_ipv6:
+        return False
+    try:
+        with socket.socket(socket.AF_INET6) as sock:
+            sock.bind(("::1", 0))
+        return True
+    except OSError:
+        return False
+
+
+HAS_IPV6 = has_ipv6()
 
 
 def is_api_healthy(path):
@@ -14,8 +35,8 @@ def is_api_healthy(path):
     address = "[::1]" if HAS_IPV6 else "127.0.0.1"
     url = f"http://{address}:24817{path}"
     print(f"Readiness probe: checking {url}")
-    response = requests.get(url, allow_redirects=True)
-    data = response.json()
+    with urllib.request.urlopen(url) as response:
+        data = json.load(response)
 
     if not data["database_connection"]["connected"]:
         print("Readiness probe: database issue")
@@ -36,8 +57,13 @@ def is_content_healthy(path):
     address = "[::1]" if HAS_IPV6 else "127.0.0.1"
     url = f"http://{address}:24816{path}"
     print(f"Readiness probe checking {url}")
-    response = requests.head(url)
-    response.raise_for_status()
+    connection = http.client.HTTPConnection(f"{address}:24816")
+    connection.request("HEAD", path)
+    response = connection.getresponse()
+    connection.close()
+    if response.status >= 400:
+        print(f"Readiness probe: content app returned {response.status}")
+        sys.exit(1)
 
     print("Readiness probe: ready!")
     sys.exit(0)
@@ -1,6 +1,12 @@
 #!/bin/bash
 
 echo "Checking for database migrations"
+# Every pod runs this check at the same time, and each check boots Django.
+# Start with a short wait so a finished migration is noticed quickly, double it
+# up to 5 seconds, and sleep a random value between half the delay and the delay
+# so pods that started together drift apart.
+delay=2
+max_delay=5
 while true; do
   /usr/local/bin/pulpcore-manager showmigrations | grep '\[ \]' &> /dev/null
   exit_code=$?
@@ -16,5 +22,6 @@ while true; do
     # which is probably because the database is not "up enough" to continue yet.
     echo "Waiting for migration, last exit code $exit_code"
   fi
-  sleep 5
+  sleep $(( (delay + 1) / 2 + RANDOM % (delay / 2 + 1) ))
+  delay=$(( delay * 2 > max_delay ? max_delay : delay * 2 ))
 done
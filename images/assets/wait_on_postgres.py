@@ -4,19 +4,28 @@ import sys
 import time
 from django.db import connection, utils
 
+# Give up after roughly the same five minutes the fixed 3 second poll allowed.
+TIMEOUT = 300
+# Start retrying quickly and back off, so a database that is almost up is
+# picked up fast while a long outage is not polled every few seconds.
+MIN_DELAY = 0.5
+MAX_DELAY = 15
+
 if __name__ == "__main__":
 
     print("Waiting on postgresql to start...")
-    for dummy in range(100):
+    deadline = time.monotonic() + TIMEOUT
+    delay = MIN_DELAY
+    while True:
         try:
             connection.ensure_connection()
             break
         except utils.OperationalError:
-            time.sleep(3)
-
-    else:
-        print("Unable to reach postgres.")
-        sys.exit(1)
+            if time.monotonic() + delay > deadline:
+                print("Unable to reach postgres.")
+                sys.exit(1)
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_DELAY)
 
     print("Postgres started.")
     sys.exit(0)